@@ -0,0 +1,180 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from hashlib import blake2b
+
+import base58
+from lto.transactions import Transfer, Lease, CancelLease, MassTransfer, Data, Anchor, Association, \
+    RevokeAssociation, Sponsorship, CancelSponsorship, Register, Burn
+
+from e2e.common.tools import generate_account, encode_hash
+
+KEY_TYPES = ['ed25519', 'secp256k1', 'secp256r1']
+LEASE_ID = base58.b58encode(bytes(range(32)))
+
+# Transaction type -> (supported versions, builder). Versions below 3 have no key type in the binary and are only
+# signed with ed25519 keys, like in the feature files.
+TRANSACTIONS = {
+    'transfer': ((2, 3), lambda recipient: Transfer(recipient.address, 100000000)),
+    'lease': ((2, 3), lambda recipient: Lease(recipient=recipient.address, amount=100000000)),
+    'cancel_lease': ((2, 3), lambda recipient: CancelLease(LEASE_ID)),
+    'mass_transfer': ((1, 3), lambda recipient: MassTransfer([{'recipient': recipient.address, 'amount': 100000000}] * 10)),
+    'data': ((3,), lambda recipient: Data({'str': 'value', 'int': 42, 'bool': True})),
+    'anchor': ((1, 3), lambda recipient: Anchor(encode_hash('benchmark'))),
+    'association': ((1, 3), lambda recipient: Association(recipient.address, association_type=1, anchor=encode_hash('benchmark'))),
+    'revoke_association': ((1, 3), lambda recipient: RevokeAssociation(recipient=recipient.address, association_type=1, anchor=encode_hash('benchmark'))),
+    'sponsorship': ((1, 3), lambda recipient: Sponsorship(recipient.address)),
+    'cancel_sponsorship': ((1, 3), lambda recipient: CancelSponsorship(recipient.address)),
+    'register': ((3,), lambda recipient: Register(recipient)),
+    'burn': ((3,), lambda recipient: Burn(100000000)),
+}
+
+
+def transaction_id(transaction):
+    return base58.b58encode(blake2b(transaction.to_binary(), digest_size=32).digest())
+
+
+def build(builder, recipient, version):
+    transaction = builder(recipient)
+    transaction.version = version
+    return transaction
+
+
+def signed(builder, recipient, version, account):
+    transaction = build(builder, recipient, version)
+    transaction.sign_with(account)
+    return transaction
+
+
+def operations(builder, recipient, version, account):
+    tx = signed(builder, recipient, version, account)
+    return {
+        'build': lambda: build(builder, recipient, version),
+        'sign': lambda: signed(builder, recipient, version, account),
+        'serialize': lambda: (tx.to_binary(), json.dumps(tx.to_json())),
+        'id': lambda: transaction_id(tx),
+    }
+
+
+def time_op(op, min_time):
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        op()
+        count += 1
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def alloc_op(op):
+    """Blocks still held after the operation (including its result) and the peak of traced memory while it ran.
+    tracemalloc only sees live blocks, so the number of short-lived allocations shows up in the peak instead."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    base, _ = tracemalloc.get_traced_memory()
+    result = op()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'filename')
+    blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    return blocks, peak - base
+
+
+def measure(name, op, min_time):
+    op()  # warm up
+    blocks, peak = alloc_op(op)
+    return {'name': name, 'ops_per_sec': time_op(op, min_time), 'retained_blocks': blocks, 'peak_bytes': peak}
+
+
+def cases(types=None, key_types=KEY_TYPES):
+    recipient = generate_account()
+    for key_type in key_types:
+        account = generate_account(key_type)
+        for tx_type, (versions, builder) in TRANSACTIONS.items():
+            if types and tx_type not in types:
+                continue
+            for version in versions:
+                if version < 3 and key_type != 'ed25519':
+                    continue
+                for op_name, op in operations(builder, recipient, version, account).items():
+                    yield f'{tx_type}/v{version}/{key_type}/{op_name}', op
+
+
+def secure_hash_case():
+    try:
+        from starter import secureHash
+    except ImportError as e:
+        return None, str(e)
+    return lambda: secureHash('open'), None
+
+
+def run(types=None, key_types=KEY_TYPES, min_time=0.2):
+    results = [measure(name, op, min_time) for name, op in cases(types, key_types)]
+
+    # starter.py needs the node image dependencies, so the case is recorded as skipped rather than left out
+    op, error = secure_hash_case()
+    if op:
+        results.append(measure('starter/secureHash', op, min_time))
+    else:
+        print(f'Skipping starter/secureHash: {error}', file=sys.stderr)
+        results.append({'name': 'starter/secureHash', 'skipped': error})
+
+    return {
+        'python': platform.python_version(),
+        'timestamp': int(time.time()),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    current = {r['name']: r for r in report['results']}
+    regressions = []
+    for old in baseline['results']:
+        if 'skipped' in old:
+            continue
+        result = current.get(old['name'])
+        if result is None or 'skipped' in result:
+            print(f"{old['name']: <50} {old['ops_per_sec']:>12.1f} -> {'missing':>12}")
+            regressions.append(old['name'])
+            continue
+        ratio = result['ops_per_sec'] / old['ops_per_sec']
+        print(f"{result['name']: <50} {old['ops_per_sec']:>12.1f} -> {result['ops_per_sec']:>12.1f} ops/s "
+              f"({ratio:6.2f}x)  peak {old['peak_bytes']} -> {result['peak_bytes']} bytes")
+        if ratio < 1 - threshold or result['peak_bytes'] > old['peak_bytes'] * (1 + threshold):
+            regressions.append(result['name'])
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark client side building, signing and serializing of transactions')
+    parser.add_argument('--type', action='append', choices=TRANSACTIONS.keys(), help='only benchmark this transaction type')
+    parser.add_argument('--key-type', action='append', choices=KEY_TYPES, help='only benchmark this key type')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds to run each operation')
+    parser.add_argument('--output', help='write the results as json to this file')
+    parser.add_argument('--compare', help='json results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    report = run(args.type, args.key_type or KEY_TYPES, args.min_time)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    elif not args.compare:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        if regressions:
+            print('Regressions: ' + ', '.join(regressions), file=sys.stderr)
+            sys.exit(1)
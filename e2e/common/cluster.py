@@ -0,0 +1,146 @@
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from lto.public_node import PublicNode
+from lto.transactions import Transfer
+
+from e2e.common import config
+from e2e.common.node import header
+from e2e.common.tools import ROOT_ACCOUNT, generate_account
+
+
+def height(url):
+    return requests.get(url + '/blocks/height', headers=header(), timeout=2).json()['height']
+
+
+def header_at(url, at):
+    return requests.get(url + '/blocks/headers/at/%d' % at, headers=header(), timeout=2).json()
+
+
+def utx_ids(url):
+    response = requests.get(url + '/transactions/unconfirmed', headers=header(), timeout=2).json()
+    return {tx['id'] for tx in response}
+
+
+def is_confirmed(url, id):
+    return requests.get(url + '/transactions/info/%s' % id, headers=header(), timeout=2).status_code == 200
+
+
+def _poll_all(executor, fn, urls):
+    return dict(zip(urls, executor.map(fn, urls)))
+
+
+def summarize(delays):
+    if not delays:
+        return {}
+    delays = sorted(delays)
+    return {
+        'count': len(delays),
+        'min': delays[0],
+        'median': statistics.median(delays),
+        'p90': delays[min(len(delays) - 1, int(len(delays) * 0.9))],
+        'max': delays[-1],
+    }
+
+
+def measure_block_propagation(urls=config.cluster_urls, blocks=10, step=0.05, timeout=600):
+    """Time until every node reaches each new height. Heights are used rather than block signatures, as the signature of
+    the last block changes with every microblock and a node may skip some of them between polls."""
+    reached = {}
+    results = []
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        start = max(_poll_all(executor, height, urls).values())
+        targets = range(start + 1, start + blocks + 1)
+        deadline = time.monotonic() + timeout
+
+        while len(results) < blocks and time.monotonic() < deadline:
+            now = time.monotonic()
+            for url, current in _poll_all(executor, height, urls).items():
+                for h in targets:
+                    if h <= current:
+                        reached.setdefault(h, {}).setdefault(url, now)
+
+            for h in targets:
+                times = reached.get(h, {})
+                if len(times) == len(urls) and not any(r['height'] == h for r in results):
+                    first = min(times.values())
+                    results.append({
+                        'height': h,
+                        'generator': header_at(urls[0], h)['generator'],
+                        'delays': {url: t - first for url, t in times.items()},
+                        'spread': max(times.values()) - first,
+                    })
+
+            time.sleep(step)
+
+    return results
+
+
+def measure_tx_propagation(urls=config.cluster_urls, transactions=10, step=0.05, timeout=60):
+    origin = PublicNode(urls[0])
+    results = []
+
+    def seen_by(id):
+        def check(url):
+            return id in utx_ids(url) or is_confirmed(url, id)
+        return check
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        for _ in range(transactions):
+            transaction = Transfer(generate_account().address, 1)
+            transaction.sign_with(ROOT_ACCOUNT)
+            id = transaction.broadcast_to(origin).id
+            start = time.monotonic()
+            delays = {}
+
+            while len(delays) < len(urls) and time.monotonic() - start < timeout:
+                pending = [url for url in urls if url not in delays]
+                now = time.monotonic()
+                for url, found in _poll_all(executor, seen_by(id), pending).items():
+                    if found:
+                        delays[url] = now - start
+                time.sleep(step)
+
+            results.append({
+                'id': id,
+                'delays': delays,
+                'spread': max(delays.values()) if len(delays) == len(urls) else None,
+            })
+
+    return results
+
+
+def measure(urls=config.cluster_urls, blocks=10, transactions=10):
+    block_results = measure_block_propagation(urls, blocks)
+    tx_results = measure_tx_propagation(urls, transactions)
+
+    return {
+        'nodes': urls,
+        'blocks': block_results,
+        'transactions': tx_results,
+        'summary': {
+            'block_spread': summarize([r['spread'] for r in block_results]),
+            'tx_spread': summarize([r['spread'] for r in tx_results if r['spread'] is not None]),
+            'tx_lost': sum(1 for r in tx_results if r['spread'] is None),
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure block and transaction propagation across a local cluster')
+    parser.add_argument('--blocks', type=int, default=10, help='number of new blocks to observe')
+    parser.add_argument('--transactions', type=int, default=10, help='number of transactions to broadcast')
+    parser.add_argument('--output', help='write the report to this file instead of stdout')
+    args = parser.parse_args()
+
+    report = json.dumps(measure(blocks=args.blocks, transactions=args.transactions), indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
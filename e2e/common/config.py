@@ -4,3 +4,15 @@ api_key = os.environ.get('LTO_API_KEY', "open")
 node_url = "http://localhost:6869"
 chain_id = 'Z'
 seed = os.environ.get('LTO_WALLET_SEED', "root")
+
+checkpoint = os.environ.get('LTO_CHECKPOINT', 'rollback')  # rollback, snapshot or none
+data_dir = os.environ.get('LTO_E2E_DATA_DIR', '/tmp/lto_e2e/data')
+snapshot_dir = os.environ.get('LTO_E2E_SNAPSHOT_DIR', '/tmp/lto_e2e/snapshot')
+
+shared_fixtures = os.environ.get('LTO_SHARED_FIXTURES', 'false').lower() in ['yes', 'true', 't', '1', 'on']
+
+batch_setup = os.environ.get('LTO_BATCH_SETUP', 'false').lower() in ['yes', 'true', 't', '1', 'on']
+
+cluster_size = int(os.environ.get('LTO_CLUSTER_SIZE', 1))
+cluster_urls = ["http://localhost:%d" % (6869 + i) for i in range(cluster_size)]
+cluster_miners = [int(i) for i in os.environ.get('LTO_CLUSTER_MINERS', '0').split(',') if i.strip()]
@@ -0,0 +1,72 @@
+import re
+from collections import Counter
+
+from behave.model import ScenarioOutline
+from lto.transactions import Transfer
+
+from e2e.common.tools import NODE, ROOT_ACCOUNT, generate_account, convert_balance, poll_txs
+
+USER = re.compile(r'\b[A-Z][a-z]+\b')
+FUNDED_ACCOUNT = re.compile(r'^(\w+) has an? (?:(\w+) )?account with (\S+) lto$')
+
+
+def find_outline(scenario):
+    for outline in scenario.feature.scenarios:
+        if isinstance(outline, ScenarioOutline) and scenario in outline.scenarios:
+            return outline
+    return None
+
+
+def users_of(step):
+    return set(USER.findall(step.name))
+
+
+def shared_users(outline):
+    rows = outline.scenarios
+    background = {step.name.split(' ')[0] for step in rows[0].background_steps}
+    used = set().union(*(users_of(step) for row in rows for step in row.steps))
+    return background - used
+
+
+def funded_accounts(outline, shared):
+    needed = Counter()
+    for row in outline.scenarios:
+        for step in row.all_steps:
+            match = FUNDED_ACCOUNT.match(step.name)
+            if match and match.group(1) not in shared and convert_balance(match.group(3)) > 0:
+                needed[(match.group(2) or 'ed25519', convert_balance(match.group(3)))] += 1
+    return needed
+
+
+def prefund_accounts(context, needed):
+    ids = []
+    for (key_type, balance), count in needed.items():
+        for _ in range(count):
+            account = generate_account(key_type)
+            transaction = Transfer(account.address, balance)
+            transaction.sign_with(ROOT_ACCOUNT)
+            ids.append(transaction.broadcast_to(NODE).id)
+            context.fixtures['pool'].setdefault((key_type, balance), []).append(account)
+    poll_txs(context, ids)
+
+
+def take_funded_account(context, key_type, balance):
+    pool = context.fixtures['pool'].get((key_type, balance))
+    return pool.pop() if pool else None
+
+
+def is_shared_fixture(context, user):
+    return context.fixtures['reuse'] and user in context.fixtures['shared']
+
+
+def setup_fixtures(context, scenario):
+    fixtures = context.fixtures
+    outline = find_outline(scenario)
+
+    if outline is None:
+        fixtures.update(outline=None, shared=set(), reuse=False, pool={})
+    elif outline is fixtures['outline']:
+        fixtures['reuse'] = True
+    else:
+        fixtures.update(outline=outline, shared=shared_users(outline), reuse=False, pool={})
+        prefund_accounts(context, funded_accounts(outline, fixtures['shared']))
@@ -15,21 +15,154 @@ def stop_node():
     subprocess.run(dir_path + "/../bin/stop_public_node", shell=True, check=True)
 
 
-def start_node():
+def start_node(data_dir=None):
     dir_path = os.path.dirname(os.path.realpath(__file__))
-    subprocess.run(dir_path + "/../bin/run_public_node", shell=True, check=True)
+    env = dict(os.environ, LTO_E2E_DATA_DIR=data_dir) if data_dir else None
+    subprocess.run(dir_path + "/../bin/run_public_node", shell=True, check=True, env=env)
 
 
-def is_node_up(timeout=1):
+def height(url=config.node_url):
+    return requests.get(url + "/blocks/height", headers=header(), timeout=5).json()['height']
+
+
+def rollback(to_height, url=config.node_url):
+    response = requests.post(url + "/debug/rollback", headers=header(), timeout=60,
+                             json={"rollbackTo": to_height, "returnTransactionsToUtx": False})
+    if response.status_code != 200:
+        raise Exception(f'Rollback of {url} to height {to_height} failed', response.text)
+
+
+def block_signature(at, url=config.node_url):
+    response = requests.get(url + "/blocks/headers/at/%d" % at, headers=header(), timeout=5)
+    return response.json()['signature'] if response.status_code == 200 else None
+
+
+def checkpoint(urls):
+    """The last block is still liquid under NG, so its signature changes with every microblock; checkpoint at the block
+    below it instead."""
+    at = max(min(height(url) for url in urls) - 1, 1)
+    return at, block_signature(at, urls[0])
+
+
+def discarded(at, urls):
+    """Signatures of the blocks above the checkpoint, which must not come back after the rollback."""
+    return {signature for signature in (block_signature(at + 1, url) for url in urls) if signature}
+
+
+def is_at_checkpoint(at, signature, discarded_blocks, url):
+    return block_signature(at, url) == signature and block_signature(at + 1, url) not in discarded_blocks
+
+
+def rollback_nodes(at, signature, discarded_blocks, urls, attempts=5):
+    """Roll back the nodes until none of them has the discarded blocks; a node may sync them back from a peer that
+    wasn't rolled back yet, so every round rolls back all remaining nodes."""
+    pending = list(urls)
+    for _ in range(attempts):
+        for url in pending:
+            if height(url) > at:
+                rollback(at, url)
+        pending = [url for url in pending if not is_at_checkpoint(at, signature, discarded_blocks, url)]
+        if not pending:
+            return
+    raise Exception(f'Unable to roll back {", ".join(pending)} to height {at}')
+
+
+def pause(containers):
+    for container in containers:
+        subprocess.run(["docker", "pause", container], check=True)
+
+
+def unpause(containers):
+    for container in containers:
+        subprocess.run(["docker", "unpause", container], check=True)
+
+
+def rollback_cluster(at, signature, urls=config.cluster_urls, miners=config.cluster_miners):
+    """Miners are paused so no new blocks are forged while the other nodes are rolled back. The miners are then rolled
+    back while the other nodes are paused, so they can't propagate the discarded blocks to nodes at the checkpoint."""
+    discarded_blocks = discarded(at, urls)
+    miner_urls = [urls[i] for i in miners]
+    others = [url for url in urls if url not in miner_urls]
+    miner_containers = [cluster_container(i) for i in miners]
+    other_containers = [cluster_container(i) for i, url in enumerate(urls) if url in others]
+
+    pause(miner_containers)
+    try:
+        rollback_nodes(at, signature, discarded_blocks, others)
+        pause(other_containers)
+    finally:
+        unpause(miner_containers)
+    try:
+        rollback_nodes(at, signature, discarded_blocks, miner_urls)
+    finally:
+        unpause(other_containers)
+
+    for url in urls:
+        polling.poll(lambda: is_at_checkpoint(at, signature, discarded_blocks, url), step=0.5, timeout=30)
+
+
+def copy_data(source, target):
+    """Replace the contents of target with a copy of source. The node writes its data as root, so the copy is made in a
+    container rather than by the (non-root) test runner."""
+    subprocess.run([
+        "docker", "run", "--rm", "--entrypoint", "sh",
+        "-v", f"{os.path.abspath(source)}:/source:ro", "-v", f"{os.path.abspath(target)}:/target",
+        "ltonetwork/public-node:dev", "-c", "find /target -mindepth 1 -delete && cp -a /source/. /target/"
+    ], check=True, capture_output=True)
+
+
+def snapshot_node(data_dir=config.data_dir, snapshot_dir=config.snapshot_dir):
+    subprocess.run("docker pause lto_public_node_e2e", shell=True, check=True)
+    try:
+        copy_data(data_dir, snapshot_dir)
+    finally:
+        subprocess.run("docker unpause lto_public_node_e2e", shell=True, check=True)
+
+
+def restore_node(data_dir=config.data_dir, snapshot_dir=config.snapshot_dir):
+    stop_node()
+    polling.poll(
+        lambda: subprocess.run("docker inspect lto_public_node_e2e", shell=True, capture_output=True).returncode != 0,
+        step=0.5,
+        timeout=30
+    )
+    copy_data(snapshot_dir, data_dir)
+    run_node_container(data_dir)
+
+
+def run_node_container(data_dir):
+    """Start the image built by run_public_node again, without rebuilding it."""
+    subprocess.run([
+        "docker", "run", "-d", "--rm", "-p", "6869:6869",
+        "-e", "LTO_NETWORK=CUSTOM", "-e", "LTO_ENABLE_REST_API=true", "-e", "LTO_API_KEY=open",
+        "-v", f"{data_dir}:/lto/data", "--name=lto_public_node_e2e", "ltonetwork/public-node:dev"
+    ], check=True, capture_output=True)
+
+
+def cluster_container(index):
+    return f"lto_cluster_node_{index}"
+
+
+def stop_cluster():
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    subprocess.run(dir_path + "/../bin/stop_cluster", shell=True, check=True)
+
+
+def start_cluster(size=config.cluster_size):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    subprocess.run([dir_path + "/../bin/run_cluster", str(size)], check=True)
+
+
+def is_node_up(timeout=1, url=config.node_url):
   try:
-    polling.poll(_ping_node, step=1, timeout=timeout)
+    polling.poll(lambda: _ping_node(url), step=1, timeout=timeout)
     return True
   except:
     return False
 
-def _ping_node():
+def _ping_node(url=config.node_url):
   try:
-    return requests.get(config.node_url + "/", headers=header(), timeout=2).status_code == 200
+    return requests.get(url + "/", headers=header(), timeout=2).status_code == 200
   except:
     return False
 
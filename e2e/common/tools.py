@@ -32,20 +32,44 @@ def get_data(address):
     return NODE.data_of(address)
 
 
-def funds_for_transaction(context, user, tx_fee):
-    account = context.users[user]
-    transaction = Transfer(account.address, tx_fee)
+def is_new_account(context, *users):
+    """An account created in this scenario can't have any leases, associations or sponsorships yet."""
+    return any(user in context.new_users for user in users)
+
+
+def is_funding(transaction, address):
+    return isinstance(transaction, Transfer) and transaction.sender == ROOT_ACCOUNT.address and \
+        transaction.recipient == address
+
+
+def top_up(context, address, amount):
+    """Transfer funds from the root account, adding them to a funding transfer that's still in the batch."""
+    pending = next((tx for tx in context.batch or [] if is_funding(tx, address)), None)
+    transaction = Transfer(address, amount + (pending.amount if pending else 0))
     transaction.sign_with(ROOT_ACCOUNT)
-    broadcast(context, transaction)
+    if pending:
+        context.batch[context.batch.index(pending)] = transaction
+    else:
+        broadcast(context, transaction)
+
+
+def expected_balance(context, address):
+    pending = [transaction for transaction in context.batch or [] if address in affected(transaction)]
+    if all(is_funding(transaction, address) for transaction in pending):
+        return get_balance(address) + sum(transaction.amount for transaction in pending)
+    wait_for(context, address)
+    return get_balance(address)
+
+
+def funds_for_transaction(context, user, tx_fee):
+    top_up(context, context.users[user].address, tx_fee)
 
 
 def minimum_balance(context, user, amount):
-    account = context.users[user]
-    balance = get_balance(account.address)
+    address = context.users[user].address
+    balance = expected_balance(context, address)
     if balance < amount:
-        transaction = Transfer(account.address, amount - balance)
-        transaction.sign_with(ROOT_ACCOUNT)
-        broadcast(context, transaction)
+        top_up(context, address, amount - balance)
 
 
 def poll_tx(context, id):
@@ -59,7 +83,77 @@ def poll_tx(context, id):
     return response
 
 
+def poll_txs(context, ids):
+    context.tx_ids.extend(ids)
+    pending = set(ids)
+
+    def confirmed():
+        for id in list(pending):
+            if 'id' in requests.get('%s%s' % (URL, ('/transactions/info/%s' % id)), headers='').json():
+                pending.discard(id)
+        return not pending
+
+    polling.poll(confirmed, step=0.1, timeout=180)
+
+
+def payers(transaction):
+    return {transaction.sender, transaction.sponsor} - {''}
+
+
+def affected(transaction):
+    recipients = {getattr(transaction, 'recipient', '')}
+    recipients.update(transfer['recipient'] for transfer in getattr(transaction, 'transfers', []))
+    return (recipients | payers(transaction)) - {''}
+
+
+def depends_on(transaction, previous):
+    return bool(payers(transaction) & (affected(previous) - {ROOT_ACCOUNT.address}))
+
+
+def batch_levels(transactions):
+    levels = []
+    for i, transaction in enumerate(transactions):
+        level = 1 + max([levels[j] for j in range(i) if depends_on(transaction, transactions[j])], default=-1)
+        levels.append(level)
+
+    grouped = [[] for _ in range(max(levels, default=-1) + 1)]
+    for transaction, level in zip(transactions, levels):
+        grouped[level].append(transaction)
+    return grouped
+
+
+def flush(context):
+    transactions, context.batch = context.batch, []
+    try:
+        for level in batch_levels(transactions):
+            poll_txs(context, [transaction.broadcast_to(NODE).id for transaction in level])
+        context.last_tx_success = True
+    except:
+        context.last_tx_success = False
+        raise
+
+    checks, context.deferred = context.deferred, []
+    for check in checks:
+        check()
+
+
+def wait_for(context, *addresses):
+    if context.batch and any(set(addresses) & affected(transaction) for transaction in context.batch):
+        flush(context)
+
+
+def defer(context, check):
+    if context.batch is not None:
+        context.deferred.append(check)
+    else:
+        check()
+
+
 def broadcast(context, transaction):
+    if context.batch is not None:
+        context.batch.append(transaction)
+        return transaction
+
     try:
         tx = transaction.broadcast_to(NODE)
         poll_tx(context, tx.id)
@@ -1,28 +1,85 @@
-from e2e.common import node
+from e2e.common import node, config
 from behave.model_core import Status
-from e2e.common.tools import get_balance
+from e2e.common.tools import get_balance, flush
+from e2e.common.fixtures import setup_fixtures
 
 
 def before_all(context):
     context.started_node = False
-    if not node.is_node_up():
-        node.start_node()
+    context.checkpoint_mode = config.checkpoint
+    if config.cluster_size > 1:
+        if not all(node.is_node_up(url=url) for url in config.cluster_urls):
+            node.start_cluster()
+            context.started_node = True
+            for url in config.cluster_urls:
+                assert node.is_node_up(60, url), f"Unable to connect to node {url}"
+    elif not node.is_node_up():
+        node.start_node(config.data_dir if config.checkpoint == 'snapshot' else None)
         context.started_node = True
         assert node.is_node_up(30), "Unable to connect to node"
 
+    if context.checkpoint_mode == 'snapshot' and (config.cluster_size > 1 or not context.started_node):
+        print('Snapshots are only available for a stand-alone node started by the tests, using rollback instead')
+        context.checkpoint_mode = 'rollback'
+    elif context.checkpoint_mode == 'snapshot':
+        node.snapshot_node()
+
 
 def after_all(context):
-    if context.started_node:
+    if context.started_node and config.cluster_size > 1:
+        node.stop_cluster()
+    elif context.started_node:
         node.stop_node()
 
 
 def before_feature(context, feature):
     context.users = {}
+    context.new_users = set()
     context.tx_ids = []
     context.last_tx_success = None
+    context.batch = None
+    context.deferred = []
+    context.fixtures = {'outline': None, 'shared': set(), 'reuse': False, 'pool': {}}
+
+    if context.checkpoint_mode == 'rollback':
+        context.checkpoint = node.checkpoint(node_urls())
+
+
+def after_feature(context, feature):
+    if context.checkpoint_mode == 'rollback':
+        at, signature = context.checkpoint
+        if config.cluster_size > 1:
+            node.rollback_cluster(at, signature)
+        else:
+            node.rollback_nodes(at, signature, node.discarded(at, node_urls()), node_urls())
+    elif context.checkpoint_mode == 'snapshot':
+        node.restore_node()
+        assert node.is_node_up(30), "Unable to connect to node"
+
+
+def node_urls():
+    return config.cluster_urls if config.cluster_size > 1 else [config.node_url]
+
+
+def before_scenario(context, scenario):
+    context.new_users = set()
+    context.batch = [] if config.batch_setup else None
+    if config.shared_fixtures:
+        setup_fixtures(context, scenario)
+
+
+def before_step(context, step):
+    if context.batch is not None and step.step_type != 'given':
+        flush(context)
+        context.batch = None
 
 
 def after_scenario(context, scenario):
+    if context.batch is not None and scenario.status != Status.failed:
+        flush(context)
+    context.batch = None
+    context.deferred = []
+
     if scenario.status == Status.failed:
         print_users(context.users)
         print_txs(context.tx_ids)
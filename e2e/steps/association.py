@@ -1,5 +1,5 @@
 from behave import *
-from e2e.common.tools import broadcast, NODE, funds_for_transaction
+from e2e.common.tools import broadcast, NODE, funds_for_transaction, wait_for, defer, is_new_account
 from lto.transactions import Association, RevokeAssociation
 
 
@@ -17,6 +17,7 @@ def association(context, sender, recipient, type, hash="", version=None):
 def is_associated(context, sender, recipient):
     sender = context.users[sender]
     recipient = context.users[recipient]
+    wait_for(context, sender.address)
 
     list_outgoing = NODE.wrapper(api='/associations/status/{}'.format(sender.address))['outgoing']
     ass_list = []
@@ -38,18 +39,22 @@ def revoke_association(context, user1, user2, type, hash="", version=None):
     broadcast(context, transaction)
 
 
+def check_associated(context, sender, recipient):
+    assert is_associated(context, sender, recipient), 'Failed to issue association'
+
+
 @given('{sender} has an association with {recipient} of type {type:d}')
 @given('{sender} has an association with {recipient} of type {type:d} and anchor {hash}')
 def step_impl(context, sender, recipient, type, hash=""):
-    if not is_associated(context, sender, recipient):
+    if is_new_account(context, sender, recipient) or not is_associated(context, sender, recipient):
         funds_for_transaction(context, sender, Association.DEFAULT_FEE)
         association(context, sender, recipient, type, hash)
-        assert is_associated(context, sender, recipient), 'Failed to issue association'
+        defer(context, lambda: check_associated(context, sender, recipient))
 
 
 @given('{sender} does not have an association with {recipient} of type {type:d}')
 def step_impl(context, sender, recipient, type):
-    if is_associated(context, sender, recipient):
+    if not is_new_account(context, sender, recipient) and is_associated(context, sender, recipient):
         funds_for_transaction(context, sender, RevokeAssociation.DEFAULT_FEE)
         revoke_association(sender, recipient, type, hash)
         assert not is_associated(context, sender, recipient, type), 'Failed to revoke association'
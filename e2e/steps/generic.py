@@ -1,17 +1,28 @@
 from behave import *
 from e2e.common.tools import *
+from e2e.common.fixtures import is_shared_fixture, take_funded_account
 from time import sleep
 
 
 @given('{user} has a new account')
 @given('{user} has a new {key_type} account')
 def step_impl(context, user, key_type='ed25519'):
+    if is_shared_fixture(context, user):
+        return
     context.users.update({user: generate_account(key_type)})
+    context.new_users.add(user)
 
 
 @given('{user} has an account with {balance} lto')
 @given('{user} has an {key_type} account with {balance} lto')
 def step_impl(context, user, key_type='ed25519', balance=0):
+    if is_shared_fixture(context, user):
+        return
+    account = take_funded_account(context, key_type, convert_balance(balance))
+    if account:
+        context.users.update({user: account})
+        context.new_users.add(user)
+        return
     context.execute_steps(u'''
         Given {user} has a new {key_type} account
         Given {user} has {balance} lto
@@ -1,12 +1,14 @@
 import lto
 from behave import *
-from e2e.common.tools import NODE, broadcast, convert_balance, funds_for_transaction, minimum_balance
+from e2e.common.tools import NODE, broadcast, convert_balance, funds_for_transaction, minimum_balance, wait_for, \
+    is_new_account
 from lto.transactions import Lease, CancelLease
 
 
 def is_leasing(context, account1, account2, amount=""):
     account1 = context.users[account1]
     account2 = context.users[account2]
+    wait_for(context, account1.address)
     lease_list = NODE.lease_list(account1.address)
     leases = []
     for lease in lease_list:
@@ -20,6 +22,7 @@ def is_leasing(context, account1, account2, amount=""):
 
 
 def get_lease_id(context, account1, account2):
+    wait_for(context, account1.address)
     lease_list = NODE.lease_list(account1.address)
     for lease in lease_list:
         if lease['recipient'] == account2.address:
@@ -53,7 +56,7 @@ def lease(context, account1, account2, amount="", version=None):
 
 @given('{user1} is not leasing to {user2}')
 def step_impl(context, user1, user2):
-    if is_leasing(context, user1, user2):
+    if not is_new_account(context, user1, user2) and is_leasing(context, user1, user2):
         funds_for_transaction(context, user1, CancelLease.DEFAULT_FEE)
         cancel_lease(context, user1, user2)
 
@@ -69,7 +72,7 @@ def step_impl(context, user1, user2):
 @given('{user1} is leasing {amount} lto to {user2}')
 def step_impl(context, user1, amount, user2):
     amount = convert_balance(amount)
-    if not is_leasing(context, user1, user2, amount):
+    if is_new_account(context, user1, user2) or not is_leasing(context, user1, user2, amount):
         minimum_balance(context, user1, amount)
         funds_for_transaction(context, user1, Lease.DEFAULT_FEE)
         lease(context, user1, user2, amount)
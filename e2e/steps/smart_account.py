@@ -1,5 +1,5 @@
 from behave import *
-from e2e.common.tools import NODE, funds_for_transaction, broadcast
+from e2e.common.tools import NODE, funds_for_transaction, broadcast, wait_for
 from lto.transactions import SetScript
 
 
@@ -14,6 +14,7 @@ def clear_script(context, user):
     broadcast(context, transaction)
 
 def has_script(context, user):
+    wait_for(context, context.users[user].address)
     response = NODE.wrapper('/addresses/scriptInfo/{}'.format(context.users[user].address))
     return 'script' in response
 
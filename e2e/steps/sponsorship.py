@@ -1,11 +1,12 @@
 from behave import *
-from e2e.common.tools import funds_for_transaction, NODE, broadcast
+from e2e.common.tools import funds_for_transaction, NODE, broadcast, wait_for, is_new_account
 from lto.transactions import Sponsorship, CancelSponsorship
 
 
 def is_sponsoring(context, user1, user2):
     account1 = context.users[user1]
     account2 = context.users[user2]
+    wait_for(context, account2.address)
     sponsorships = NODE.sponsorship_list(account2.address)
     if account1.address in sponsorships['sponsor']:
         return sponsorships
@@ -33,14 +34,14 @@ def cancel_sponsorship(context, sponsored, sponsoring, version=None):
 
 @given('{user1} is not sponsoring {user2}')
 def step_impl(context, user1, user2):
-    if is_sponsoring(context, user1, user2):
+    if not is_new_account(context, user1, user2) and is_sponsoring(context, user1, user2):
         funds_for_transaction(context, user1, CancelSponsorship.DEFAULT_FEE)
         cancel_sponsorship(context, user2, user1)
 
 
 @given('{user1} is sponsoring {user2}')
 def step_impl(context, user1, user2):
-    if not is_sponsoring(context, user1, user2):
+    if is_new_account(context, user1, user2) or not is_sponsoring(context, user1, user2):
         funds_for_transaction(context, user1, Sponsorship.DEFAULT_FEE)
         sponsor(context, user2, user1)
 
@@ -1,5 +1,6 @@
 from behave import *
-from e2e.common.tools import ROOT_ACCOUNT, convert_balance, get_balance, broadcast, assert_equals
+from e2e.common.tools import ROOT_ACCOUNT, convert_balance, get_balance, broadcast, assert_equals, wait_for, defer
+from e2e.common.fixtures import is_shared_fixture
 from lto.transactions import Transfer
 
 
@@ -22,18 +23,23 @@ def transfer_to(context, recipient="", amount=0, sender="", version=None):
 
 @given('{user} has {balance} lto')
 def step_impl(context, user, balance):
+    if is_shared_fixture(context, user):
+        return
     balance = convert_balance(balance)
-    user_balance = get_balance(context.users[user].address)
+    address = context.users[user].address
+    wait_for(context, address)
+    user_balance = get_balance(address)
 
     if user_balance < balance:
         transfer_to(context, recipient=user, amount=balance - user_balance)
     elif user_balance > balance:
         if user_balance - balance <= Transfer.DEFAULT_FEE:
             transfer_to(context, recipient=user, amount=Transfer.DEFAULT_FEE)
-        user_balance = get_balance(context.users[user].address)
+        wait_for(context, address)
+        user_balance = get_balance(address)
         transfer_to(context, amount=user_balance - (balance + Transfer.DEFAULT_FEE), sender=user)
 
-    assert_equals(get_balance(context.users[user].address), balance)
+    defer(context, lambda: assert_equals(get_balance(address), balance))
 
 
 @then('{user} has {balance} lto')
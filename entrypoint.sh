@@ -1,5 +1,9 @@
 #!/bin/bash
 
+if [[ "${LTO_PROFILE_STARTUP,,}" =~ ^(yes|true|t|1|on)$ ]]; then
+  exec /usr/bin/python3 "/lto-node/startup_profiler.py"
+fi
+
 /usr/bin/python3 "/lto-node/starter.py"
 
 echo $LTO_CONFIG_FILE
@@ -52,7 +52,6 @@ case class TransactionsApiRoute(settings: RestAPISettings,
 
   private val invalidLimit = StatusCodes.BadRequest -> Json.obj("message" -> "invalid.limit")
 
-  //TODO implement general pagination
   @GET
   @Path("/address/{address}/limit/{limit}")
   @Operation(
@@ -73,6 +72,13 @@ case class TransactionsApiRoute(settings: RestAPISettings,
         required = true,
         schema = new Schema(implementation = classOf[Int]),
         in = ParameterIn.PATH
+      ),
+      new Parameter(
+        name = "after",
+        description = "Id of the last transaction of the previous page, to return the transactions before it",
+        required = false,
+        schema = new Schema(implementation = classOf[String]),
+        in = ParameterIn.QUERY
       )
     )
   )
@@ -85,13 +91,16 @@ case class TransactionsApiRoute(settings: RestAPISettings,
             pathEndOrSingleSlash {
               complete(invalidLimit)
             } ~
-              path(Segment) { limitStr =>
+              (path(Segment) & parameter('after.?)) { (limitStr, after) =>
                 Exception.allCatch.opt(limitStr.toInt) match {
+                  case Some(_) if after.exists(ByteStr.decodeBase58(_).isFailure) =>
+                    complete(InvalidSignature)
                   case Some(limit) if limit > 0 && limit <= MaxTransactionsPerRequest =>
-                    complete(
-                      Json.arr(JsArray(blockchain
-                        .addressTransactions(a, Set.empty, limit, 0)
-                        .map({ case (h, tx) => txToCompactJson(a, tx) + ("height" -> JsNumber(h)) }))))
+                    blockchain.addressTransactions(a, Set.empty, limit, after.map(ByteStr.decodeBase58(_).get)) match {
+                      case Some(txs) =>
+                        complete(Json.arr(JsArray(txs.map({ case (h, tx) => txToCompactJson(a, tx) + ("height" -> JsNumber(h)) }))))
+                      case None => complete(TransactionNotExists)
+                    }
                   case Some(limit) if limit > MaxTransactionsPerRequest =>
                     complete(TooBigArrayAllocation)
                   case _ =>
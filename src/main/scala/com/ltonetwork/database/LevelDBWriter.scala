@@ -464,6 +464,57 @@ class LevelDBWriter(writableDB: DB, fs: FunctionalitySettings, val maxCacheSize:
     }
   }
 
+  override def addressTransactions(address: Address,
+                                   types: Set[Byte],
+                                   count: Int,
+                                   after: Option[ByteStr]): Option[Seq[(Int, Transaction)]] = readOnly { db =>
+    db.get(Keys.addressId(address)) match {
+      case None => if (after.isEmpty) Some(Seq.empty) else None
+      case Some(addressId) =>
+        val lastSeqNr = db.get(Keys.addressTransactionSeqNr(addressId))
+
+        // The cursor must be in the sequence number found by its height, so an unknown cursor never scans the history
+        val start = after match {
+          case None => Some((lastSeqNr, Seq.empty[(Int, ByteStr)]))
+          case Some(id) =>
+            for {
+              h <- db.get(Keys.transactionHeight(id))
+              seqNr = addressSeqNrAtHeight(db, addressId, lastSeqNr, h)
+              ids   = db.get(Keys.addressTransactionIds(addressId, seqNr))
+              if ids.exists(_._2 == id)
+            } yield (seqNr - 1, ids.dropWhile(_._2 != id).drop(1))
+        }
+
+        start.map {
+          case (startSeqNr, rest) =>
+            val ids = rest.view ++ (startSeqNr to 1 by -1).view.flatMap(seqNr => db.get(Keys.addressTransactionIds(addressId, seqNr)))
+            val txs = for {
+              (txType, txId) <- ids
+              if types.isEmpty || types.contains(txType.toByte)
+              (h, tx) <- db.get(Keys.transactionInfo(txId))
+            } yield (h, tx)
+
+            txs.take(count).force
+        }
+    }
+  }
+
+  /** Lowest sequence number of the address transactions at or above the height; sequence numbers increase with height. */
+  private def addressSeqNrAtHeight(db: ReadOnlyDB, addressId: BigInt, lastSeqNr: Int, height: Int): Int = {
+    def heightOf(seqNr: Int): Int =
+      db.get(Keys.addressTransactionIds(addressId, seqNr)).headOption.flatMap(e => db.get(Keys.transactionHeight(e._2))).getOrElse(0)
+
+    @tailrec
+    def search(low: Int, high: Int): Int =
+      if (low >= high) high
+      else {
+        val mid = (low + high) / 2
+        if (heightOf(mid) >= height) search(low, mid) else search(mid + 1, high)
+      }
+
+    search(1, lastSeqNr)
+  }
+
   override def leaseDetails(leaseId: ByteStr): Option[LeaseDetails] = readOnly { db =>
     db.get(Keys.transactionInfo(leaseId)) match {
       case Some((h, lt: LeaseTransaction)) =>
@@ -126,6 +126,7 @@ object NetworkServer extends ScorexLogging {
         .bind(settings.networkSettings.bindAddress)
         .channel()
     }
+    serverChannel.foreach(_ => log.info(s"Network server was bound on ${settings.networkSettings.bindAddress}"))
 
     val outgoingChannels = new ConcurrentHashMap[InetSocketAddress, Channel]
 
@@ -45,6 +45,9 @@ trait Blockchain {
 
   def addressTransactions(address: Address, types: Set[Byte], count: Int, from: Int): Seq[(Int, Transaction)]
 
+  /** Transactions of the address older than the transaction `after`, newest first. None if `after` isn't a transaction of the address. */
+  def addressTransactions(address: Address, types: Set[Byte], count: Int, after: Option[ByteStr]): Option[Seq[(Int, Transaction)]]
+
   def containsTransaction(id: ByteStr): Boolean
   def forgetTransactions(pred: (ByteStr, Long) => Boolean): Map[ByteStr, Long]
   def learnTransactions(values: Map[ByteStr, Long]): Unit
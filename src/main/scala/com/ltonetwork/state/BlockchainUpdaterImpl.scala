@@ -33,6 +33,7 @@ class BlockchainUpdaterImpl(blockchain: Blockchain, settings: LtoSettings, time:
   private lazy val maxBlockReadinessAge = settings.minerSettings.intervalAfterLastBlockThenGenerationIsAllowed.toMillis
 
   private var ngState: Option[NgState]              = Option.empty
+  private var synced: Boolean                       = false
   private var restTotalConstraint: MiningConstraint = MiningConstraints(settings.minerSettings, blockchain, blockchain.height).total
 
   private val service               = monix.execution.Scheduler.singleThread("last-block-info-publisher")
@@ -201,7 +202,12 @@ class BlockchainUpdaterImpl(blockchain: Blockchain, settings: LtoSettings, time:
               val height = blockchain.height + 1
               restTotalConstraint = updatedTotalConstraint
               ngState = Some(new NgState(block, newBlockDiff, carry, featuresApprovedWithBlock(block)))
-              lastBlockId.foreach(id => internalLastBlockInfo.onNext(LastBlockInfo(id, height, score, blockchainReady)))
+              val ready = blockchainReady
+              lastBlockId.foreach(id => internalLastBlockInfo.onNext(LastBlockInfo(id, height, score, ready)))
+              if (ready && !synced) {
+                synced = true
+                log.info(s"Blockchain is up to date at height $height")
+              }
               if ((block.timestamp > time
                     .getTimestamp() - settings.minerSettings.intervalAfterLastBlockThenGenerationIsAllowed.toMillis) || (height % 100 == 0)) {
                 log.info(s"New height: $height")
@@ -416,6 +422,25 @@ class BlockchainUpdaterImpl(blockchain: Blockchain, settings: LtoSettings, time:
       }
     }
 
+  override def addressTransactions(address: Address,
+                                   types: Set[Byte],
+                                   count: Int,
+                                   after: Option[ByteStr]): Option[Seq[(Int, Transaction)]] =
+    ngState.fold(blockchain.addressTransactions(address, types, count, after)) { ng =>
+      val diff = ng.bestLiquidDiff
+      diffTransactionsAfter(diff, address, types, after).flatMap { fromDiff =>
+        val transactionsFromDiff = fromDiff.take(count).toSeq
+        val actualTxCount        = transactionsFromDiff.length
+
+        if (actualTxCount == count) Some(transactionsFromDiff)
+        else {
+          blockchain
+            .addressTransactions(address, types, count - actualTxCount, after.filterNot(diff.transactions.contains))
+            .map(transactionsFromDiff ++ _)
+        }
+      }
+    }
+
   override def containsTransaction(id: AssetId): Boolean = ngState.fold(blockchain.containsTransaction(id)) { ng =>
     ng.bestLiquidDiff.transactions.contains(id) || blockchain.containsTransaction(id)
   }
@@ -37,6 +37,27 @@ package object state {
     def noneIfEmpty: Option[ByteStr] = opt.collect { case h if h.toString.nonEmpty => h }
   }
 
+  /** Transactions of the address in the diff after the cursor, which are all newer than the persisted ones. They're in the
+    * same (-height, -timestamp) order as in LevelDB. A cursor that isn't in the diff yields no transactions, while a
+    * cursor that is in the diff but isn't a transaction of the address yields None. */
+  def diffTransactionsAfter(diff: Diff, address: Address, types: Set[Byte], after: Option[ByteStr]): Option[Seq[(Int, Transaction)]] = {
+    val ids = diff.accountTransactionIds.getOrElse(address, List.empty)
+
+    def load(ids: List[(Int, ByteStr)]): Seq[(Int, Transaction)] =
+      ids.collect {
+        case (typeId, id) if types.isEmpty || types.contains(typeId.toByte) =>
+          val (height, tx, _) = diff.transactions(id)
+          (height, tx)
+      }
+
+    after match {
+      case None                                        => Some(load(ids))
+      case Some(id) if !diff.transactions.contains(id) => Some(Seq.empty)
+      case Some(id) if ids.exists(_._2 == id)          => Some(load(ids.dropWhile(_._2 != id).drop(1)))
+      case Some(_)                                     => None
+    }
+  }
+
   implicit class Cast[A](a: A) {
     def cast[B: ClassTag]: Option[B] = {
       a match {
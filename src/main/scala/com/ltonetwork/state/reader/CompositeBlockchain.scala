@@ -57,6 +57,24 @@ class CompositeBlockchain(inner: Blockchain, maybeDiff: => Option[Diff], carry:
     }
   }
 
+  override def addressTransactions(address: Address,
+                                   types: Set[Byte],
+                                   count: Int,
+                                   after: Option[ByteStr]): Option[Seq[(Int, Transaction)]] = {
+    val currentDiff = diff
+    diffTransactionsAfter(currentDiff, address, types, after).flatMap { fromDiff =>
+      val transactionsFromDiff = fromDiff.take(count).toSeq
+      val actualTxCount        = transactionsFromDiff.length
+
+      if (actualTxCount == count) Some(transactionsFromDiff)
+      else {
+        inner
+          .addressTransactions(address, types, count - actualTxCount, after.filterNot(currentDiff.transactions.contains))
+          .map(transactionsFromDiff ++ _)
+      }
+    }
+  }
+
   override def allActiveLeases: Set[LeaseTransaction] = {
     val (active, canceled) = diff.leaseState.partition(_._2)
     val fromDiff = active.keys
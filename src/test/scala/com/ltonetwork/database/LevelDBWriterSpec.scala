@@ -125,26 +125,26 @@ class LevelDBWriterSpec extends AnyFreeSpec with Matchers with WithDB with Reque
   }
 
   "addressTransactions" - {
-    "return txs in correct ordering" in {
-      val preconditions = (ts: Long) => {
-        for {
-          master    <- accountGen
-          recipient <- accountGen
-          genesisBlock = TestBlock
-            .create(ts, Seq(GenesisTransaction.create(master, ENOUGH_AMT, ts).explicitGet()))
-          block1 = TestBlock
-            .create(
-              ts + 3,
-              genesisBlock.uniqueId,
-              Seq(
-                createTransfer(master, recipient.toAddress, ts + 1),
-                createTransfer(master, recipient.toAddress, ts + 2)
-              )
+    val preconditions = (ts: Long) => {
+      for {
+        master    <- accountGen
+        recipient <- accountGen
+        genesisBlock = TestBlock
+          .create(ts, Seq(GenesisTransaction.create(master, ENOUGH_AMT, ts).explicitGet()))
+        block1 = TestBlock
+          .create(
+            ts + 3,
+            genesisBlock.uniqueId,
+            Seq(
+              createTransfer(master, recipient.toAddress, ts + 1),
+              createTransfer(master, recipient.toAddress, ts + 2)
             )
-          emptyBlock = TestBlock.create(ts + 5, block1.uniqueId, Seq())
-        } yield (master, List(genesisBlock, block1, emptyBlock))
-      }
+          )
+        emptyBlock = TestBlock.create(ts + 5, block1.uniqueId, Seq())
+      } yield (master, List(genesisBlock, block1, emptyBlock))
+    }
 
+    "return txs in correct ordering" in {
       baseTest(time => preconditions(time.correctedTime())) { (writer, account) =>
         val txs = writer
           .addressTransactions(account.toAddress, Set(TransferTransaction.typeId), 3, 0)
@@ -158,6 +158,28 @@ class LevelDBWriterSpec extends AnyFreeSpec with Matchers with WithDB with Reque
       }
     }
 
+    "continue after the cursor" in {
+      baseTest(time => preconditions(time.correctedTime())) { (writer, account) =>
+        val all   = writer.addressTransactions(account.toAddress, Set.empty, 10, None).get
+        val first = writer.addressTransactions(account.toAddress, Set.empty, 1, None).get
+        val rest  = writer.addressTransactions(account.toAddress, Set.empty, 10, Some(first.last._2.id())).get
+
+        all.length shouldBe 3
+        first ++ rest shouldBe all
+        writer.addressTransactions(account.toAddress, Set.empty, 10, Some(all.last._2.id())) shouldBe Some(Seq.empty)
+      }
+    }
+
+    "reject a cursor that isn't a transaction of the address" in {
+      baseTest(time => preconditions(time.correctedTime())) { (writer, account) =>
+        writer.addressTransactions(account.toAddress, Set.empty, 10, Some(TestBlock.randomSignature())) shouldBe None
+        writer.addressTransactions(accountGen.sample.get.toAddress, Set.empty, 10, None) shouldBe Some(Seq.empty)
+
+        val genesis = writer.addressTransactions(account.toAddress, Set.empty, 10, None).get.last._2
+        writer.addressTransactions(accountGen.sample.get.toAddress, Set.empty, 10, Some(genesis.id())) shouldBe None
+      }
+    }
+
     def createTransfer(master: PrivateKeyAccount, recipient: Address, ts: Long): TransferTransaction = {
       TransferTransaction
         .signed(1, ts, master, 100 * 1000 * 1000L, recipient, ENOUGH_AMT / 5, Array.emptyByteArray)
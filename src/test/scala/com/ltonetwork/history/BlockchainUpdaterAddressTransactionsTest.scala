@@ -0,0 +1,125 @@
+package com.ltonetwork.history
+
+import com.ltonetwork.TransactionGen
+import com.ltonetwork.account.Address
+import com.ltonetwork.block.{Block, MicroBlock}
+import com.ltonetwork.lagonaki.mocks.TestBlock
+import com.ltonetwork.state._
+import com.ltonetwork.state.diffs._
+import com.ltonetwork.transaction.Transaction
+import com.ltonetwork.transaction.genesis.GenesisTransaction
+import org.scalacheck.Gen
+import org.scalatest.matchers.should.Matchers
+import org.scalatest.propspec.AnyPropSpec
+import org.scalatestplus.scalacheck.ScalaCheckDrivenPropertyChecks
+
+class BlockchainUpdaterAddressTransactionsTest
+    extends AnyPropSpec
+    with ScalaCheckDrivenPropertyChecks
+    with DomainScenarioDrivenPropertyCheck
+    with Matchers
+    with TransactionGen {
+
+  // The first block is persisted once the key block arrives; the key block and its microblocks stay in the liquid diff
+  type Setup = (Address, Address, Block, Block, Seq[MicroBlock])
+  val preconditions: Gen[Setup] = for {
+    master    <- accountGen
+    recipient <- accountGen
+    other     <- accountGen
+    ts        <- positiveIntGen
+    fee       <- smallFeeGen
+  } yield {
+    val genesis = GenesisTransaction.create(master, ENOUGH_AMT, ts).explicitGet()
+    val transfers = (1 to 5).map(i => createLtoTransfer(master, recipient, 100000000L, fee, ts + i).explicitGet())
+
+    val persisted = customBuildBlockOfTxs(randomSig, Seq(genesis) ++ transfers.take(2), TestBlock.defaultSigner, 3, ts)
+    val (keyBlock, microBlocks) =
+      chainBaseAndMicro(persisted.uniqueId, transfers.slice(2, 3), Seq(transfers.slice(3, 4), transfers.slice(4, 5)), TestBlock.defaultSigner, 3, ts)
+
+    (master.toAddress, other.toAddress, persisted, keyBlock, microBlocks)
+  }
+
+  // All transactions of the address are in the liquid diff, until the next block persists them
+  type LiquidSetup = (Address, Block, Block, Seq[MicroBlock], Block)
+  val liquidPreconditions: Gen[LiquidSetup] = for {
+    master    <- accountGen
+    recipient <- accountGen
+    ts        <- positiveIntGen
+    fee       <- smallFeeGen
+  } yield {
+    val genesis = GenesisTransaction.create(master, ENOUGH_AMT, ts).explicitGet()
+    val transfers = (1 to 9).map(i => createLtoTransfer(master, recipient, 100000000L, fee, ts + i).explicitGet())
+
+    val persisted = customBuildBlockOfTxs(randomSig, Seq(genesis), TestBlock.defaultSigner, 3, ts)
+    val (keyBlock, microBlocks) =
+      chainBaseAndMicro(persisted.uniqueId, transfers.take(3), Seq(transfers.slice(3, 6), transfers.slice(6, 8)), TestBlock.defaultSigner, 3, ts)
+    val next = customBuildBlockOfTxs(microBlocks.last.totalResBlockSig, transfers.drop(8), TestBlock.defaultSigner, 3, ts)
+
+    (master.toAddress, persisted, keyBlock, microBlocks, next)
+  }
+
+  private def page(domain: Domain, address: Address, count: Int, after: Option[Transaction]): Seq[(Int, Transaction)] =
+    domain.blockchainUpdater.addressTransactions(address, Set.empty, count, after.map(_.id())).get
+
+  private def pages(domain: Domain, address: Address, count: Int): Seq[(Int, Transaction)] =
+    Iterator
+      .iterate(page(domain, address, count, None))(previous => page(domain, address, count, previous.lastOption.map(_._2)))
+      .takeWhile(_.nonEmpty)
+      .flatten
+      .toSeq
+
+  property("pages through the liquid diff and the persisted blocks with a cursor") {
+    scenario(preconditions, MicroblocksActivatedAt0LtoSettings) {
+      case (domain, (master, _, persisted, keyBlock, microBlocks)) =>
+        domain.blockchainUpdater.processBlock(persisted).explicitGet()
+        domain.blockchainUpdater.processBlock(keyBlock).explicitGet()
+        microBlocks.foreach(domain.blockchainUpdater.processMicroBlock(_).explicitGet())
+
+        val all = domain.blockchainUpdater.addressTransactions(master, Set.empty, 10, None).get
+        all.length shouldBe 6
+
+        // cursor in the diff, in LevelDB while the diff isn't empty, and pages across the boundary
+        all.indices.foreach { i =>
+          page(domain, master, 10, Some(all(i)._2)) shouldBe all.drop(i + 1)
+        }
+        (1 to 4).foreach { count =>
+          pages(domain, master, count) shouldBe all
+        }
+    }
+  }
+
+  property("keeps the order of the liquid diff when it's persisted between two pages") {
+    scenario(liquidPreconditions, MicroblocksActivatedAt0LtoSettings) {
+      case (domain, (master, persisted, keyBlock, microBlocks, next)) =>
+        domain.blockchainUpdater.processBlock(persisted).explicitGet()
+        domain.blockchainUpdater.processBlock(keyBlock).explicitGet()
+        microBlocks.foreach(domain.blockchainUpdater.processMicroBlock(_).explicitGet())
+
+        val all = domain.blockchainUpdater.addressTransactions(master, Set.empty, 20, None).get
+        all.length shouldBe 9
+
+        val first = page(domain, master, 3, None)
+        first shouldBe all.take(3)
+
+        domain.blockchainUpdater.processBlock(next).explicitGet()
+
+        page(domain, master, 3, first.lastOption.map(_._2)) shouldBe all.slice(3, 6)
+        page(domain, master, 20, first.lastOption.map(_._2)) shouldBe all.drop(3)
+    }
+  }
+
+  property("rejects a cursor that isn't a transaction of the address") {
+    scenario(preconditions, MicroblocksActivatedAt0LtoSettings) {
+      case (domain, (master, other, persisted, keyBlock, microBlocks)) =>
+        domain.blockchainUpdater.processBlock(persisted).explicitGet()
+        domain.blockchainUpdater.processBlock(keyBlock).explicitGet()
+        microBlocks.foreach(domain.blockchainUpdater.processMicroBlock(_).explicitGet())
+
+        val all = domain.blockchainUpdater.addressTransactions(master, Set.empty, 10, None).get
+
+        domain.blockchainUpdater.addressTransactions(master, Set.empty, 10, Some(randomSig)) shouldBe None
+        domain.blockchainUpdater.addressTransactions(other, Set.empty, 10, Some(all.head._2.id())) shouldBe None
+        domain.blockchainUpdater.addressTransactions(other, Set.empty, 10, Some(all.last._2.id())) shouldBe None
+    }
+  }
+}
@@ -1,12 +1,12 @@
 package com.ltonetwork.http
 
 import akka.http.scaladsl.model.StatusCodes
-import com.ltonetwork.account.{PrivateKeyAccount, PublicKeyAccount}
-import com.ltonetwork.api.{InvalidAddress, InvalidSignature, TooBigArrayAllocation, TransactionsApiRoute}
+import com.ltonetwork.account.{Address, PrivateKeyAccount, PublicKeyAccount}
+import com.ltonetwork.api.{InvalidAddress, InvalidSignature, TooBigArrayAllocation, TransactionNotExists, TransactionsApiRoute}
 import com.ltonetwork.features.BlockchainFeatures
 import com.ltonetwork.http.ApiMarshallers._
 import com.ltonetwork.settings.{FeeSettings, FeesSettings, TestFunctionalitySettings, WalletSettings}
-import com.ltonetwork.state.Blockchain
+import com.ltonetwork.state.{Blockchain, ByteStr}
 import com.ltonetwork.transaction.Proofs
 import com.ltonetwork.transaction.transfer.{MassTransferTransaction, TransferTransaction}
 import com.ltonetwork.utils.Base58
@@ -134,6 +134,26 @@ class TransactionsRouteSpec
       }
     }
 
+    "handles invalid cursor" in {
+      forAll(accountGen, alphaNumStr.map(_ + "O")) {
+        case (account, invalidBase58) =>
+          Get(routePath(s"/address/${account.address}/limit/10?after=$invalidBase58")) ~> route should produce(InvalidSignature)
+      }
+    }
+
+    "handles unknown cursor" in {
+      forAll(accountGen, bytes64gen) {
+        case (account, bytes) =>
+          val after = ByteStr(bytes)
+          (blockchain
+            .addressTransactions(_: Address, _: Set[Byte], _: Int, _: Option[ByteStr]))
+            .expects(account.toAddress, Set.empty[Byte], 10, Some(after))
+            .returning(None)
+            .once()
+          Get(routePath(s"/address/${account.address}/limit/10?after=${after.base58}")) ~> route should produce(TransactionNotExists)
+      }
+    }
+
   }
 
   routePath("/info/{signature}") - {
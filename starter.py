@@ -125,6 +125,10 @@ if __name__ == "__main__":
     if LTO_FEATURES is not None:
         nested_set(env_dict, ['lto', 'features', 'supported'], LTO_FEATURES.split(','))
 
+    LTO_KNOWN_PEERS = os.getenv('LTO_KNOWN_PEERS')
+    if LTO_KNOWN_PEERS is not None:
+        nested_set(env_dict, ['lto', 'network', 'known-peers'], [p for p in LTO_KNOWN_PEERS.split(',') if p])
+
     config = ConfigFactory.from_dict(env_dict)
     local_conf = HOCONConverter.convert(config, 'hocon')
     with open(confFilePath, 'w') as file:
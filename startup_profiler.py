@@ -0,0 +1,159 @@
+import os
+import os.path
+import re
+import json
+import signal
+import subprocess
+import sys
+import threading
+import time
+import requests
+
+LTO_DIRECTORY = '/lto'
+LOG_FILE = LTO_DIRECTORY + '/log/lto.log'
+PROFILE_DIR = LTO_DIRECTORY + '/startup'
+
+REST_URL = os.environ.get('LTO_PROFILE_REST_URL', 'http://127.0.0.1:6869')
+TIMEOUT = int(os.environ.get('LTO_PROFILE_TIMEOUT', 1800))
+
+# Phases that are detected in the node log, in the order they are expected
+LOG_PHASES = [
+    ('jvm_started', re.compile(r'Starting\.\.\.')),
+    ('settings_loaded', re.compile(r'Blockchain Id: ')),
+    ('leveldb_opened', re.compile(r'Open DB at ')),
+    ('state_loaded', re.compile(r"Data directory '")),
+    ('network_bound', re.compile(r'Network server was bound on ')),
+    ('rest_api_bound', re.compile(r'REST API was bound on ')),
+    ('first_synced_block', re.compile(r'Blockchain is up to date at height ')),
+]
+
+
+class Profile:
+    def __init__(self):
+        self.start = time.time()
+        self.events = {}
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def mark(self, phase):
+        with self.lock:
+            if phase not in self.events:
+                self.events[phase] = time.time()
+                print('[startup] {} after {:.2f}s'.format(phase, self.events[phase] - self.start), flush=True)
+
+    def has(self, phase):
+        with self.lock:
+            return phase in self.events
+
+    def report(self, status):
+        with self.lock:
+            ordered = sorted(self.events.items(), key=lambda e: e[1])
+        phases = []
+        previous = self.start
+        for phase, timestamp in ordered:
+            phases.append({'phase': phase, 'at': round(timestamp - self.start, 3), 'duration': round(timestamp - previous, 3)})
+            previous = timestamp
+        return {
+            'started': int(self.start * 1000),
+            'status': status,
+            'network': os.environ.get('LTO_NETWORK', 'MAINNET'),
+            'total': round(previous - self.start, 3),
+            'phases': phases,
+        }
+
+
+def log_size():
+    return os.path.getsize(LOG_FILE) if os.path.isfile(LOG_FILE) else 0
+
+
+def follow_log(profile, offset):
+    phases = [(phase, pattern) for phase, pattern in LOG_PHASES if phase != 'rest_api_bound' or rest_api_enabled()]
+    while not os.path.isfile(LOG_FILE) and not profile.done.is_set():
+        time.sleep(0.1)
+
+    with open(LOG_FILE, errors='replace') as file:
+        file.seek(offset if offset <= log_size() else 0)
+        while phases and not profile.done.is_set():
+            line = file.readline()
+            if not line:
+                time.sleep(0.1)
+                continue
+            for phase, pattern in list(phases):
+                if pattern.search(line):
+                    profile.mark(phase)
+                    phases.remove((phase, pattern))
+
+
+def poll_rest_api(profile):
+    while not profile.done.is_set():
+        try:
+            if requests.get(REST_URL + '/', timeout=2).status_code == 200:
+                profile.mark('rest_api_ready')
+                return
+        except:
+            pass
+        time.sleep(0.5)
+
+
+def rest_api_enabled():
+    enabled = os.environ.get('ENABLE_REST_API', os.environ.get('LTO_ENABLE_REST_API', 'false'))
+    return enabled.lower() in ['yes', 'true', 't', '1', 'on'] or os.environ.get('LTO_NETWORK') == 'TESTNET'
+
+
+def write_report(report):
+    if not os.path.isdir(PROFILE_DIR):
+        os.mkdir(PROFILE_DIR)
+    with open(PROFILE_DIR + '/latest.json', 'w') as file:
+        json.dump(report, file, indent=2)
+    with open(PROFILE_DIR + '/history.jsonl', 'a') as file:
+        file.write(json.dumps(report) + '\n')
+
+
+def print_report(report):
+    print('[startup] Time to ready: {:.2f}s ({})'.format(report['total'], report['status']), flush=True)
+    for phase in report['phases']:
+        print('[startup]   {:<20} {:>9.2f}s {:>9.2f}s'.format(phase['phase'], phase['duration'], phase['at']), flush=True)
+
+
+if __name__ == "__main__":
+    profile = Profile()
+
+    subprocess.run(['/usr/bin/python3', '/lto-node/starter.py'], check=True)
+    profile.mark('config_generated')
+
+    config_file = os.environ.get('LTO_CONFIG_FILE')
+    offset = log_size()
+    node = subprocess.Popen([
+        os.environ['JAVA_HOME'] + '/bin/java',
+        '-Dlogback.stdout.level=' + os.environ.get('LTO_LOG_LEVEL', 'INFO'),
+        '-Xmx' + os.environ.get('LTO_HEAP_SIZE', '2g'),
+        '-jar', '/lto-node/lto-public-all.jar'
+    ] + ([config_file] if config_file else []))
+    profile.mark('jvm_launched')
+
+    for sig in [signal.SIGTERM, signal.SIGINT]:
+        signal.signal(sig, lambda signum, frame: node.send_signal(signum))
+
+    watchers = [threading.Thread(target=follow_log, args=(profile, offset), daemon=True)]
+    if rest_api_enabled():
+        watchers.append(threading.Thread(target=poll_rest_api, args=(profile,), daemon=True))
+    for watcher in watchers:
+        watcher.start()
+
+    deadline = profile.start + TIMEOUT
+    while any(w.is_alive() for w in watchers) and node.poll() is None and time.time() < deadline:
+        time.sleep(0.5)
+
+    if node.poll() is not None:
+        status = 'exited'
+    elif any(w.is_alive() for w in watchers):
+        status = 'timeout'
+    else:
+        status = 'ready'
+    profile.done.set()
+
+    report = profile.report(status)
+    write_report(report)
+    print_report(report)
+
+    sys.exit(node.wait())
@@ -0,0 +1,37 @@
+import os
+import threading
+import requests
+
+NODE_URL = os.environ.get('LTO_NODE_URL', 'http://localhost:6869')
+API_KEY = os.environ.get('LTO_API_KEY', '')
+
+_local = threading.local()
+
+
+def session():
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+        if API_KEY:
+            _local.session.headers.update({'X-API-Key': API_KEY})
+    return _local.session
+
+
+def get(path, url=NODE_URL, timeout=10, params=None):
+    response = session().get(url + path, timeout=timeout, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def last_header(url=NODE_URL):
+    return get('/blocks/headers/last', url)
+
+
+def headers(start, end, url=NODE_URL):
+    result = []
+    for first in range(start, end + 1, 100):
+        result += get('/blocks/headers/seq/%d/%d' % (first, min(first + 99, end)), url)
+    return result
+
+
+def add_node_arguments(parser):
+    parser.add_argument('--node', default=NODE_URL, help='url of the node REST API (default: $LTO_NODE_URL or %(default)s)')
@@ -0,0 +1,217 @@
+import argparse
+import codecs
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tools import api
+
+MAX_LIMIT = 10000
+
+COLUMNS = ('id', 'type', 'version', 'height', 'timestamp', 'sender', 'sponsor', 'fee', 'recipient', 'amount', 'anchors')
+
+WHITESPACE = '[], \t\r\n'
+
+
+class ExportError(Exception):
+    pass
+
+
+def stream_items(chunks):
+    """Yield the objects of a (nested) json array as soon as each of them has been received."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                break
+            yield item
+        buffer = buffer[position:]
+
+
+def stream_page(address, limit, after, url):
+    params = {'after': after} if after else None
+    with api.session().get('%s/transactions/address/%s/limit/%d' % (url, address, limit),
+                           params=params, timeout=60, stream=True) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        yield from stream_items(decoder.decode(chunk) for chunk in response.iter_content(chunk_size=65536))
+
+
+def check_exists(id, url):
+    """Fail when a cursor was rolled back, rather than silently ending or restarting the export."""
+    try:
+        api.get('/transactions/info/%s' % id, url)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            raise ExportError('transaction %s is no longer in the blockchain' % id) from e
+        raise
+
+
+def row(tx):
+    return (
+        tx['id'],
+        tx['type'],
+        tx.get('version', ''),
+        tx.get('height', ''),
+        tx['timestamp'],
+        tx.get('sender', ''),
+        tx.get('sponsor') or '',
+        tx.get('fee', 0),
+        tx.get('recipient', ''),
+        tx.get('amount', tx.get('totalAmount', '')),
+        ';'.join(tx.get('anchors', ())),
+    )
+
+
+class Cursor:
+    """Export progress of an address, stored next to the csv file so that a next run appends to it.
+
+    The history is exported newest first. `oldest` is the last exported transaction of the backfill, while
+    `catchup` tracks the transactions that were added on top of `newest` since the previous run.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.newest = None
+        self.oldest = None
+        self.complete = False
+        self.catchup = None
+        if os.path.isfile(path):
+            with open(path) as file:
+                self.__dict__.update(json.load(file))
+
+    def save(self):
+        state = {key: value for key, value in self.__dict__.items() if key != 'path'}
+        with open(self.path + '.tmp', 'w') as file:
+            json.dump(state, file)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def export_page(address, after, until, limit, url, writer, cursor):
+    count = 0
+    last = after
+    for tx in stream_page(address, limit, after, url):
+        if tx['id'] == until:
+            return count, True, last
+        if tx['id'] == after:
+            raise ExportError('the node at %s ignores the after cursor' % url)
+        writer.writerow(row(tx))
+        count += 1
+        last = tx['id']
+        if cursor.newest is None:
+            cursor.newest = last
+    return count, False, last
+
+
+def export_pages(address, after, until, limit, url, writer, file, cursor, on_page):
+    """Write the pages after the transaction `after`, until the transaction `until` or the end of the history.
+
+    A page that fails is removed from the csv again, so the file always matches the saved cursor.
+    """
+    exported = 0
+    while True:
+        file.flush()
+        start = file.tell()
+        try:
+            count, reached, last = export_page(address, after, until, limit, url, writer, cursor)
+            if not reached and count < limit:
+                if until is not None:
+                    raise ExportError('transaction %s was not found in the history' % until)
+                if count == 0 and after is not None:
+                    check_exists(after, url)
+        except BaseException:
+            file.seek(start)
+            file.truncate()
+            raise
+
+        file.flush()
+        if count:
+            after = last
+            on_page(after)
+            cursor.save()
+        exported += count
+
+        if reached or count < limit:
+            return exported
+
+
+def export_address(address, directory, limit=1000, url=api.NODE_URL):
+    path = os.path.join(directory, address + '.csv')
+    cursor = Cursor(path + '.cursor')
+    exported = 0
+
+    with open(path, 'a', newline='') as file:
+        writer = csv.writer(file)
+        if file.tell() == 0:
+            writer.writerow(COLUMNS)
+
+        while cursor.catchup is not None or cursor.newest or cursor.complete:
+            if cursor.catchup is None:
+                cursor.catchup = {'after': None, 'until': cursor.newest}
+                cursor.newest = None
+            catchup = cursor.catchup
+            resumed = catchup['after'] is not None
+            if catchup['until'] is not None:
+                check_exists(catchup['until'], url)
+            exported += export_pages(address, catchup['after'], catchup['until'], limit, url, writer, file, cursor,
+                                     lambda after: catchup.update(after=after))
+            cursor.newest = cursor.newest or catchup['until']
+            cursor.catchup = None
+            cursor.save()
+            if not resumed:
+                break
+
+        if not cursor.complete:
+            exported += export_pages(address, cursor.oldest, None, limit, url, writer, file, cursor,
+                                     lambda after: setattr(cursor, 'oldest', after))
+            cursor.complete = True
+            cursor.save()
+
+    return exported
+
+
+def export(addresses, directory, limit=1000, url=api.NODE_URL, workers=4):
+    os.makedirs(directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {address: executor.submit(export_address, address, directory, limit, url) for address in addresses}
+        for address, future in futures.items():
+            try:
+                print('%s exported %d transactions' % (address, future.result()), flush=True)
+            except Exception as e:
+                print('%s failed: %s' % (address, e), file=sys.stderr, flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Export the transaction history of addresses to csv, appending on each run')
+    parser.add_argument('addresses', nargs='*', help='addresses to export')
+    parser.add_argument('--file', help='file with one address per line')
+    api.add_node_arguments(parser)
+    parser.add_argument('--output', default='.', help='directory of the csv files (default: current directory)')
+    parser.add_argument('--limit', type=int, default=1000, help='transactions per request (max %d)' % MAX_LIMIT)
+    parser.add_argument('--workers', type=int, default=4, help='number of addresses exported concurrently')
+    args = parser.parse_args()
+
+    addresses = list(args.addresses)
+    if args.file:
+        with open(args.file) as file:
+            addresses += [line.strip() for line in file if line.strip()]
+    if not addresses:
+        parser.error('no addresses to export')
+    if not 0 < args.limit <= MAX_LIMIT:
+        parser.error('limit must be between 1 and %d' % MAX_LIMIT)
+
+    try:
+        export(addresses, args.output, args.limit, args.node, args.workers)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,192 @@
+import argparse
+import csv
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tools import api
+
+MIN_GENERATING_BALANCE = 100000000000  # 1000 LTO
+
+BALANCE_FIELDS = ('effective', 'generating', 'leased_in', 'leases_in')
+FIELDS = BALANCE_FIELDS + ('blocks',)
+
+
+class BalanceHistory:
+    def __init__(self, addresses, capacity):
+        self.capacity = capacity
+        self.heights = array('l')
+        self.series = {address: {field: array('q') for field in FIELDS} for address in addresses}
+        self.missing = {address: array('b') for address in addresses}
+
+    def append(self, height, values, blocks):
+        """Append the values of a height; an address without values (None) is recorded as a gap."""
+        self.heights.append(height)
+        for address, series in self.series.items():
+            self.missing[address].append(values[address] is None)
+            for field in BALANCE_FIELDS:
+                series[field].append(values[address][field] if values[address] is not None else 0)
+            series['blocks'].append(blocks[address])
+
+        excess = len(self.heights) - self.capacity
+        if excess > 0:
+            del self.heights[:excess]
+            for address, series in self.series.items():
+                del self.missing[address][:excess]
+                for column in series.values():
+                    del column[:excess]
+
+    def __len__(self):
+        return len(self.heights)
+
+    def value(self, address, field, index=-1):
+        if field != 'blocks' and self.missing[address][index]:
+            return None
+        return self.series[address][field][index]
+
+    def blocks_produced(self, address):
+        return sum(self.series[address]['blocks'])
+
+    def span(self):
+        return self.heights[-1] - self.heights[0] + 1 if self.heights else 0
+
+    def write_csv(self, file):
+        writer = csv.writer(file)
+        writer.writerow(('height', 'address') + FIELDS)
+        for i, height in enumerate(self.heights):
+            for address in self.series:
+                values = (self.value(address, field, i) for field in FIELDS)
+                writer.writerow((height, address) + tuple('' if value is None else value for value in values))
+
+
+def fetch_address(address, confirmations, url):
+    effective = api.get('/addresses/effectiveBalance/%s/%d' % (address, confirmations), url)['balance']
+    generating = api.get('/consensus/generatingbalance/%s' % address, url)['balance']
+    leases = [lease for lease in api.get('/leasing/active/%s' % address, url) if lease['recipient'] == address]
+    return {
+        'effective': effective,
+        'generating': generating,
+        'leased_in': sum(lease['amount'] for lease in leases),
+        'leases_in': len(leases),
+    }
+
+
+def fetch(executor, addresses, confirmations, url):
+    futures = {address: executor.submit(fetch_address, address, confirmations, url) for address in addresses}
+    values = {}
+    for address, future in futures.items():
+        try:
+            values[address] = future.result()
+        except requests.RequestException as e:
+            print('Unable to fetch %s: %s' % (address, e), file=sys.stderr, flush=True)
+            values[address] = None
+    return values
+
+
+def count_generated(blocks, addresses):
+    counts = dict.fromkeys(addresses, 0)
+    for block in blocks:
+        if block['generator'] in counts:
+            counts[block['generator']] += 1
+    return counts
+
+
+def alerts(history, address, min_balance, threshold):
+    if len(history) < 2:
+        return []
+
+    previous = history.value(address, 'generating', -2)
+    current = history.value(address, 'generating')
+    if previous is None or current is None:
+        return []
+    messages = []
+
+    if previous >= min_balance > current:
+        messages.append('can no longer forge, generating balance dropped to %d' % current)
+    elif current >= min_balance > previous:
+        messages.append('can forge again, generating balance is %d' % current)
+    elif previous and abs(current - previous) / previous > threshold:
+        messages.append('generating balance changed from %d to %d' % (previous, current))
+
+    return messages
+
+
+def report(history, addresses):
+    print('%-36s %20s %20s %20s %8s %10s' % ('height %d' % history.heights[-1], 'effective', 'generating', 'leased in', 'leases', 'blocks'))
+    for address in addresses:
+        values = tuple('-' if value is None else value for value in (history.value(address, field) for field in BALANCE_FIELDS))
+        print('%-36s %20s %20s %20s %8s %4d / %-4d' % ((address,) + values + (history.blocks_produced(address), history.span())),
+              flush=True)
+
+
+def monitor(addresses, url=api.NODE_URL, confirmations=1000, interval=1.0, capacity=10000, min_balance=MIN_GENERATING_BALANCE,
+            threshold=0.1, report_every=10, workers=16):
+    history = BalanceHistory(addresses, capacity)
+    last_height = None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            try:
+                height = api.last_header(url)['height']
+                if height == last_height:
+                    time.sleep(interval)
+                    continue
+
+                start = height if last_height is None else last_height + 1
+                blocks = executor.submit(api.headers, start, height, url)
+                values = fetch(executor, addresses, confirmations, url)
+                generated = count_generated(blocks.result(), addresses)
+            except requests.RequestException as e:
+                print('Unable to poll %s: %s' % (url, e), file=sys.stderr, flush=True)
+                time.sleep(interval)
+                continue
+
+            history.append(height, values, generated)
+            last_height = height
+
+            for address in addresses:
+                for message in alerts(history, address, min_balance, threshold):
+                    print('ALERT height %d %s %s' % (height, address, message), file=sys.stderr, flush=True)
+
+            if report_every and len(history) % report_every == 0:
+                report(history, addresses)
+
+            yield history
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Monitor generating balance, incoming leases and block production of miners')
+    parser.add_argument('addresses', nargs='*', help='addresses to monitor')
+    parser.add_argument('--file', help='file with one address per line')
+    api.add_node_arguments(parser)
+    parser.add_argument('--confirmations', type=int, default=1000, help='confirmations for the effective balance')
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between checks for a new block')
+    parser.add_argument('--history', type=int, default=10000, help='number of heights to keep')
+    parser.add_argument('--min-balance', type=int, default=MIN_GENERATING_BALANCE, help='minimal generating balance to forge')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative change of the generating balance to alert on')
+    parser.add_argument('--report-every', type=int, default=10, help='print a report every n blocks')
+    parser.add_argument('--workers', type=int, default=16, help='number of concurrent requests')
+    parser.add_argument('--csv', help='write the history to this file on exit')
+    args = parser.parse_args()
+
+    addresses = list(args.addresses)
+    if args.file:
+        with open(args.file) as file:
+            addresses += [line.strip() for line in file if line.strip()]
+    if not addresses:
+        parser.error('no addresses to monitor')
+
+    history = None
+    try:
+        for history in monitor(addresses, args.node, args.confirmations, args.interval, args.history, args.min_balance,
+                               args.threshold, args.report_every, args.workers):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.csv and history is not None:
+            with open(args.csv, 'w', newline='') as file:
+                history.write_csv(file)
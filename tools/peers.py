@@ -0,0 +1,165 @@
+import argparse
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tools import api
+from tools.stats import RingBuffer
+
+
+class PeerStats:
+    def __init__(self, address, window):
+        self.address = address
+        self.name = ''
+        self.version = ''
+        self.latency = RingBuffer(window)
+        self.lag = RingBuffer(window, 'l')
+        self.connected = RingBuffer(window, 'b')
+        self.last_seen = 0
+
+    def uptime(self):
+        return self.connected.mean() or 0.0
+
+    def score(self):
+        lag = self.lag.percentile(0.5)
+        latency = self.latency.percentile(0.5)
+        return (
+            -round(self.uptime(), 1),
+            lag if lag is not None else float('inf'),
+            latency if latency is not None else float('inf'),
+        )
+
+
+def parse_address(address):
+    if not address or address == 'N/A':
+        return None
+    host, _, port = address.rsplit('/', 1)[-1].rpartition(':')
+    return host, int(port)
+
+
+def connect_latency(address, timeout):
+    start = time.perf_counter()
+    try:
+        with socket.create_connection(address, timeout=timeout):
+            return time.perf_counter() - start
+    except OSError:
+        return None
+
+
+def peer_height(host, port, timeout):
+    try:
+        return api.get('/blocks/height', 'http://%s:%d' % (host, port), timeout=timeout)['height']
+    except Exception:
+        return None
+
+
+def sample_peer(peer, api_port, timeout):
+    # only peers with a declared address accept connections; the address of an inbound connection has an ephemeral port
+    address = parse_address(peer.get('declaredAddress'))
+    latency = connect_latency(address, timeout) if address else None
+    height = peer_height(address[0], api_port, timeout) if address and api_port else None
+    return address, latency, height
+
+
+class PeerMonitor:
+    def __init__(self, url=api.NODE_URL, window=360, max_peers=256, api_port=None, timeout=2.0, workers=16):
+        self.url = url
+        self.window = window
+        self.max_peers = max_peers
+        self.api_port = api_port
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.peers = {}
+
+    def sample(self):
+        try:
+            height = api.get('/blocks/height', self.url)['height']
+            connected = api.get('/peers/connected', self.url)['peers']
+        except requests.RequestException as e:
+            print('Unable to poll %s: %s' % (self.url, e), file=sys.stderr, flush=True)
+            return False
+        now = time.time()
+
+        seen = set()
+        samples = self.executor.map(lambda peer: sample_peer(peer, self.api_port, self.timeout), connected)
+        for peer, (address, latency, peer_height) in zip(connected, samples):
+            if address is None:
+                continue
+            key = '%s:%d' % address
+            seen.add(key)
+            stats = self.peers.get(key) or self.track(key)
+            stats.name = peer['peerName']
+            stats.version = peer['applicationVersion']
+            stats.last_seen = now
+            stats.connected.append(1)
+            if latency is not None:
+                stats.latency.append(latency)
+            if peer_height is not None:
+                stats.lag.append(height - peer_height)
+
+        for key, stats in self.peers.items():
+            if key not in seen:
+                stats.connected.append(0)
+
+        return True
+
+    def track(self, key):
+        if len(self.peers) >= self.max_peers:
+            del self.peers[min(self.peers.values(), key=lambda s: s.last_seen).address]
+        self.peers[key] = PeerStats(key, self.window)
+        return self.peers[key]
+
+    def ranked(self):
+        return sorted(self.peers.values(), key=PeerStats.score)
+
+    def known_peers(self, count):
+        return ','.join(stats.address for stats in self.ranked()[:count])
+
+
+def print_ranking(monitor):
+    print('%-24s %-20s %-8s %8s %12s %12s %8s' % ('peer', 'name', 'version', 'uptime', 'latency ms', 'p90 ms', 'lag'))
+    for stats in monitor.ranked():
+        latency = stats.latency.percentile(0.5)
+        p90 = stats.latency.percentile(0.9)
+        lag = stats.lag.percentile(0.5)
+        print('%-24s %-20s %-8s %7.0f%% %12s %12s %8s' % (
+            stats.address,
+            stats.name[:20],
+            stats.version,
+            stats.uptime() * 100,
+            '%.1f' % (latency * 1000) if latency is not None else '-',
+            '%.1f' % (p90 * 1000) if p90 is not None else '-',
+            lag if lag is not None else '-'
+        ), flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Monitor latency, block lag and uptime of the connected peers')
+    api.add_node_arguments(parser)
+    parser.add_argument('--interval', type=float, default=10.0, help='seconds between samples')
+    parser.add_argument('--window', type=int, default=360, help='number of samples kept per peer')
+    parser.add_argument('--max-peers', type=int, default=256, help='maximum number of peers to track')
+    parser.add_argument('--api-port', type=int, help='REST API port of the peers, to compare their height with ours')
+    parser.add_argument('--timeout', type=float, default=2.0, help='timeout of a connection to a peer')
+    parser.add_argument('--samples', type=int, default=0, help='stop after this many samples (0 runs until interrupted)')
+    parser.add_argument('--report-every', type=int, default=6, help='print the ranking every n samples')
+    parser.add_argument('--known-peers', type=int, default=10, help='number of peers to suggest for known-peers')
+    args = parser.parse_args()
+
+    monitor = PeerMonitor(args.node, args.window, args.max_peers, args.api_port, args.timeout)
+    count = 0
+    try:
+        while not args.samples or count < args.samples:
+            if monitor.sample():
+                count += 1
+                if count % args.report_every == 0:
+                    print_ranking(monitor)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    print_ranking(monitor)
+    print('LTO_KNOWN_PEERS=' + monitor.known_peers(args.known_peers))
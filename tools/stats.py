@@ -0,0 +1,25 @@
+from array import array
+
+
+class RingBuffer:
+    def __init__(self, size, typecode='d'):
+        self.values = array(typecode, [0] * size)
+        self.size = size
+        self.count = 0
+
+    def append(self, value):
+        self.values[self.count % self.size] = value
+        self.count += 1
+
+    def items(self):
+        return self.values[:min(self.count, self.size)]
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    def mean(self):
+        return sum(self.items()) / len(self) if len(self) else None
+
+    def percentile(self, p):
+        items = sorted(self.items())
+        return items[min(len(items) - 1, int(len(items) * p))] if items else None
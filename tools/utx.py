@@ -0,0 +1,201 @@
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tools import api
+from tools.stats import RingBuffer
+
+TRANSACTION_TYPES = {
+    4: 'transfer',
+    8: 'lease',
+    9: 'cancel_lease',
+    11: 'mass_transfer',
+    12: 'data',
+    13: 'set_script',
+    15: 'anchor',
+    16: 'association',
+    17: 'revoke_association',
+    18: 'sponsorship',
+    19: 'cancel_sponsorship',
+    20: 'register',
+    21: 'burn',
+}
+
+
+def type_id(value):
+    if value.isdigit():
+        return int(value)
+    for id, name in TRANSACTION_TYPES.items():
+        if name == value:
+            return id
+    raise ValueError('Unknown transaction type %s' % value)
+
+
+def inclusion_height(id, url):
+    """Height of the block that includes the transaction, or None if it isn't in the blockchain."""
+    try:
+        return api.get('/transactions/info/%s' % id, url).get('height')
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return None
+        raise
+
+
+class Inclusions:
+    def __init__(self, window):
+        self.fees = RingBuffer(window, 'q')
+        self.waits = RingBuffer(window)
+
+    def append(self, fee, wait):
+        self.fees.append(fee)
+        self.waits.append(wait)
+
+    def waits_for(self, fee):
+        return [wait for f, wait in zip(self.fees.items(), self.waits.items()) if f >= fee]
+
+
+class UtxAnalyzer:
+    def __init__(self, url=api.NODE_URL, window=1000, max_pending=100000, workers=16):
+        self.url = url
+        self.window = window
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = {}
+        self.inclusions = {}
+        self.included = 0
+        self.dropped = 0
+        self.started = time.time()
+        self.utx = []
+
+    def sample(self):
+        try:
+            self.utx = api.get('/transactions/unconfirmed', self.url)
+        except requests.RequestException as e:
+            print('Unable to poll %s: %s' % (self.url, e), file=sys.stderr, flush=True)
+            return False
+        now = time.time()
+
+        # The wait is counted from the transaction timestamp rather than from the sample that first sees it, so
+        # transactions that were already in the pool at start-up or arrived between samples don't appear to wait less.
+        # This includes the time between signing and broadcasting, and is clamped at 0 for clock differences.
+        current = {tx['id'] for tx in self.utx}
+        for tx in self.utx:
+            if tx['id'] not in self.pending:
+                self.pending[tx['id']] = (min(tx['timestamp'] / 1000, now), tx['type'], tx['fee'])
+
+        gone = {id: self.executor.submit(inclusion_height, id, self.url) for id in self.pending if id not in current}
+        for id, future in gone.items():
+            try:
+                height = future.result()
+            except requests.RequestException:
+                continue  # checked again on the next sample
+            timestamp, type, fee = self.pending.pop(id)
+            if height:
+                self.included += 1
+                self.inclusions.setdefault(type, Inclusions(self.window)).append(fee, now - timestamp)
+            else:
+                self.dropped += 1
+
+        for id in list(self.pending)[:max(0, len(self.pending) - self.max_pending)]:
+            del self.pending[id]
+
+        return True
+
+    def throughput(self):
+        elapsed = time.time() - self.started
+        return self.included / elapsed if elapsed > 0 else 0.0
+
+    def estimate(self, type, fee):
+        waits = self.inclusions[type].waits_for(fee) if type in self.inclusions else []
+        if not waits:
+            waits = [wait for inclusions in self.inclusions.values() for wait in inclusions.waits_for(fee)]
+        waits.sort()
+        throughput = self.throughput()
+        return {
+            'type': TRANSACTION_TYPES.get(type, type),
+            'fee': fee,
+            'observations': len(waits),
+            'median': waits[len(waits) // 2] if waits else None,
+            'p90': waits[min(len(waits) - 1, int(len(waits) * 0.9))] if waits else None,
+            'queue_drain': len(self.utx) / throughput if throughput else None,
+        }
+
+    def groups(self, top=10):
+        by_sender = Counter(tx['sender'] for tx in self.utx)
+        return {
+            'size': len(self.utx),
+            'by_type': dict(Counter(TRANSACTION_TYPES.get(tx['type'], str(tx['type'])) for tx in self.utx)),
+            'by_fee': dict(sorted(Counter(tx['fee'] for tx in self.utx).items())),
+            'sponsored': sum(1 for tx in self.utx if tx.get('sponsor')),
+            'top_senders': dict(by_sender.most_common(top)),
+        }
+
+    def summary(self, estimates=()):
+        return {
+            'utx': self.groups(),
+            'included': self.included,
+            'dropped': self.dropped,
+            'throughput': self.throughput(),
+            'estimates': [self.estimate(type, fee) for type, fee in estimates],
+        }
+
+
+def print_summary(summary):
+    utx = summary['utx']
+    print('UTX size %d (%d sponsored), included %d, dropped %d, %.2f tx/s' % (
+        utx['size'], utx['sponsored'], summary['included'], summary['dropped'], summary['throughput']))
+    for name, count in sorted(utx['by_type'].items(), key=lambda item: -item[1]):
+        print('  %-20s %8d' % (name, count))
+    for estimate in summary['estimates']:
+        print('  estimate %s with fee %d: median %s, p90 %s (%d observations), queue drains in %s' % (
+            estimate['type'], estimate['fee'],
+            '%.1fs' % estimate['median'] if estimate['median'] is not None else '-',
+            '%.1fs' % estimate['p90'] if estimate['p90'] is not None else '-',
+            estimate['observations'],
+            '%.1fs' % estimate['queue_drain'] if estimate['queue_drain'] is not None else '-'
+        ))
+
+
+def parse_estimate(value):
+    type, _, fee = value.partition(':')
+    return type_id(type), int(fee)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Analyze the UTX pool and estimate the time until a transaction is included')
+    api.add_node_arguments(parser)
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between samples')
+    parser.add_argument('--window', type=int, default=1000, help='number of inclusions kept per transaction type')
+    parser.add_argument('--samples', type=int, default=0, help='stop after this many samples (0 runs until interrupted)')
+    parser.add_argument('--report-every', type=int, default=10, help='print a summary every n samples')
+    parser.add_argument('--estimate', action='append', type=parse_estimate, default=[], metavar='TYPE:FEE',
+                        help='estimate the inclusion delay of a transaction type (name or id) with this fee')
+    parser.add_argument('--json', action='store_true', help='print the summaries as json')
+    args = parser.parse_args()
+
+    analyzer = UtxAnalyzer(args.node, args.window)
+    count = 0
+
+    def report():
+        summary = analyzer.summary(args.estimate)
+        if args.json:
+            print(json.dumps(summary), flush=True)
+        else:
+            print_summary(summary)
+
+    try:
+        while not args.samples or count < args.samples:
+            if analyzer.sample():
+                count += 1
+                if count % args.report_every == 0:
+                    report()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    report()